@@ -1,13 +1,15 @@
 """
 Distance Calculation Demo
 
-This script demonstrates the find_distance() method of the HandDetector class.
-It shows how to calculate distances between hand landmarks and visualize them.
+This script demonstrates distance calculation between hand landmarks
+detected by the HandDetector class and how to visualize them.
 """
 
 import cv2
+import numpy as np
 import time
 import HandTrackingModule as htm
+import HandTrackingModule_fast as htm_fast
 
 # Hand landmark constants for easy reference
 THUMB_TIP = 4
@@ -16,6 +18,45 @@ MIDDLE_FINGER_TIP = 12
 RING_FINGER_TIP = 16
 PINKY_TIP = 20
 
+# Landmark pairs whose distances are displayed, with their labels
+FINGER_PAIRS = np.array([
+    (THUMB_TIP, INDEX_FINGER_TIP),
+    (INDEX_FINGER_TIP, MIDDLE_FINGER_TIP),
+    (THUMB_TIP, PINKY_TIP),
+], dtype=np.intp)
+PAIR_LABELS = ("Thumb-Index", "Index-Middle", "Thumb-Pinky")
+
+# Weight of the newest frame in the smoothed FPS reading
+FPS_SMOOTHING = 0.1
+
+
+def render_label_strip():
+    """
+    Pre-render the static overlay text so only the numbers change per frame.
+    
+    Returns:
+        tuple: (strip, mask, value_origins) where strip is the rendered
+        overlay, mask marks its text pixels and value_origins holds the
+        putText origin for each pair's distance value.
+    """
+    strip = np.zeros((130, 480, 3), dtype=np.uint8)
+    value_origins = []
+    
+    for row, label in enumerate(PAIR_LABELS):
+        text = f"{label} Distance: "
+        origin = (10, 30 * (row + 1))
+        cv2.putText(strip, text, origin, cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 2)
+        
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_PLAIN, 2, 2)
+        value_origins.append((origin[0] + text_width, origin[1]))
+    
+    # MediaPipe always reports 21 landmarks, so this line never changes
+    cv2.putText(strip, "Landmarks detected: 21", (10, 120), 
+               cv2.FONT_HERSHEY_PLAIN, 1.5, (255, 255, 0), 2)
+    
+    mask = strip.any(axis=2)
+    return strip, mask, value_origins
+
 
 def main():
     """
@@ -27,72 +68,86 @@ def main():
     print()
     
     # Initialize camera
-    cap = cv2.VideoCapture(0)
-    detector = htm.HandDetector()
+    cap = htm.open_camera(0)
+    # Track a single hand on a half-resolution copy of each frame;
+    # landmarks still map to the full frame
+    detector = htm.HandDetector(max_hands=1, inference_scale=0.5)
+    
+    # Render the static overlay text once
+    label_strip, label_mask, value_origins = render_label_strip()
+    strip_height, strip_width = label_mask.shape
+    
+    # Bind per-frame calls to locals to skip repeated attribute lookups
+    read_latest_frame = htm.read_latest_frame
+    pairwise_distances = htm_fast.pairwise_distances
+    find_hands = detector.find_hands
+    find_landmarks = detector.find_landmarks
+    line, circle, putText = cv2.line, cv2.circle, cv2.putText
+    imshow, waitKey = cv2.imshow, cv2.waitKey
+    now = time.monotonic
+    
+    # Match HandDetector.find_distance's drawing style
+    line_color, line_thickness = htm.DISTANCE_LINE_COLOR, htm.DISTANCE_LINE_THICKNESS
+    point_color, point_radius = htm.DISTANCE_POINT_COLOR, htm.DISTANCE_POINT_RADIUS
     
     # Initialize FPS calculator
-    previous_time = 0
+    previous_time = now()
+    fps_ema = None
+    frame_read_time = now()
     
     while True:
-        # Read frame from camera
-        success, image = cap.read()
+        # Read the newest frame, dropping any that went stale while processing
+        success, image = read_latest_frame(cap, now() - frame_read_time)
+        frame_read_time = now()
         if not success:
             print("Failed to read from camera")
             break
         
         # Detect hands
-        image = detector.find_hands(image, draw=True)
-        landmark_list = detector.find_position(image, draw=False)
+        image = find_hands(image, draw=True)
+        landmarks = find_landmarks(image, draw=False)
         
         # Calculate and display distances if hand is detected
-        if len(landmark_list) != 0:
-            # Calculate distance between thumb and index finger
-            thumb_pos = landmark_list[THUMB_TIP]
-            index_pos = landmark_list[INDEX_FINGER_TIP]
-            
-            distance, image, coords = detector.find_distance(
-                thumb_pos, index_pos, image, draw=True
-            )
-            
-            # Display distance on screen
-            cv2.putText(image, f"Thumb-Index Distance: {distance:.1f}px", 
-                       (10, 30), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 2)
-            
-            # Calculate distance between index and middle finger
-            middle_pos = landmark_list[MIDDLE_FINGER_TIP]
-            distance2, image, coords2 = detector.find_distance(
-                index_pos, middle_pos, image, draw=True
-            )
-            
-            cv2.putText(image, f"Index-Middle Distance: {distance2:.1f}px", 
-                       (10, 60), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 2)
-            
-            # Calculate distance between thumb and pinky
-            pinky_pos = landmark_list[PINKY_TIP]
-            distance3, image, coords3 = detector.find_distance(
-                thumb_pos, pinky_pos, image, draw=True
-            )
+        if len(landmarks) != 0:
+            # Calculate all pair distances in a single compiled kernel call
+            distances = pairwise_distances(landmarks, FINGER_PAIRS)
+            start_points = landmarks[FINGER_PAIRS[:, 0]]
+            end_points = landmarks[FINGER_PAIRS[:, 1]]
             
-            cv2.putText(image, f"Thumb-Pinky Distance: {distance3:.1f}px", 
-                       (10, 90), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 2)
+            # Blit the pre-rendered labels, keeping the video behind them;
+            # clip to the frame like putText does on small cameras
+            rows = min(strip_height, image.shape[0])
+            cols = min(strip_width, image.shape[1])
+            np.copyto(image[:rows, :cols], label_strip[:rows, :cols],
+                      where=label_mask[:rows, :cols, None])
             
-            # Display landmark information
-            cv2.putText(image, f"Landmarks detected: {len(landmark_list)}", 
-                       (10, 120), cv2.FONT_HERSHEY_PLAIN, 1.5, (255, 255, 0), 2)
+            # Draw each pair and display only its distance value on screen
+            for start, end, distance, value_origin in zip(
+                    start_points.tolist(), end_points.tolist(),
+                    distances.tolist(), value_origins):
+                line(image, start, end, line_color, line_thickness)
+                circle(image, start, point_radius, point_color, cv2.FILLED)
+                circle(image, end, point_radius, point_color, cv2.FILLED)
+                
+                putText(image, f"{distance:.1f}px", value_origin, 
+                        cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 2)
         
-        # Calculate and display FPS
-        current_time = time.time()
-        fps = 1 / (current_time - previous_time)
+        # Calculate and display smoothed FPS (guarding against a zero interval)
+        current_time = now()
+        fps = 1 / max(current_time - previous_time, 1e-6)
+        fps_ema = fps if fps_ema is None else (
+            (1 - FPS_SMOOTHING) * fps_ema + FPS_SMOOTHING * fps
+        )
         previous_time = current_time
         
-        cv2.putText(image, f"FPS: {int(fps)}", (10, image.shape[0] - 20), 
-                   cv2.FONT_HERSHEY_PLAIN, 2, (255, 0, 255), 2)
+        putText(image, f"FPS: {int(fps_ema)}", (10, image.shape[0] - 20), 
+                cv2.FONT_HERSHEY_PLAIN, 2, (255, 0, 255), 2)
         
         # Display the image
-        cv2.imshow("Distance Calculation Demo", image)
+        imshow("Distance Calculation Demo", image)
         
         # Exit on 'q' key press
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        if waitKey(1) & 0xFF == ord('q'):
             break
     
     # Clean up
@@ -9,6 +9,16 @@ import cv2
 import mediapipe as mp
 import time
 
+# Frame rate the loop aims to keep up with
+TARGET_FPS = 30
+
+# Upper bound on stale frames dropped per read when the backend doesn't
+# report its queue depth (typical webcam queue depth)
+MAX_STALE_FRAMES = 4
+
+# Weight of the newest frame in the smoothed FPS reading
+FPS_SMOOTHING = 0.1
+
 
 def main():
     """
@@ -19,6 +29,13 @@ def main():
     """
     # Initialize camera capture
     cap = cv2.VideoCapture(0)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
+    # Never skip more frames than the driver can have queued; grabbing past
+    # the queue blocks until the camera delivers a new frame. Backends that
+    # don't report a queue depth return 0 or -1.
+    queue_depth = int(cap.get(cv2.CAP_PROP_BUFFERSIZE))
+    max_stale = queue_depth - 1 if queue_depth > 0 else MAX_STALE_FRAMES
     
     # Initialize MediaPipe hands solution
     mp_hands = mp.solutions.hands
@@ -30,20 +47,38 @@ def main():
     )
     mp_draw = mp.solutions.drawing_utils
 
+    # Bind per-frame calls to locals to skip repeated attribute lookups
+    grab, retrieve = cap.grab, cap.retrieve
+    process = hands.process
+    cvtColor, putText = cv2.cvtColor, cv2.putText
+    imshow, waitKey = cv2.imshow, cv2.waitKey
+    now = time.monotonic
+
     # Initialize timing variables for FPS calculation
-    previous_time = 0
+    previous_time = now()
     current_time = 0
+    fps_ema = None
+    frame_read_time = now()
 
     while True:
-        # Read frame from camera
-        success, image = cap.read()
+        # Skip frames that queued up while the previous one was processed;
+        # grab() only dequeues, so the dropped frames are never decoded
+        stale_frames = min(int((now() - frame_read_time) * TARGET_FPS), max_stale)
+        for _ in range(stale_frames):
+            grab()
+
+        # Read the newest frame from camera
+        success = grab()
+        if success:
+            success, image = retrieve()
+        frame_read_time = now()
         if not success:
             print("Failed to read from camera")
             break
             
         # Convert BGR to RGB for MediaPipe processing
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = hands.process(image_rgb)
+        image_rgb = cvtColor(image, cv2.COLOR_BGR2RGB)
+        results = process(image_rgb)
 
         # Process detected hands
         if results.multi_hand_landmarks:
@@ -58,20 +93,23 @@ def main():
                 # Draw hand landmarks and connections
                 mp_draw.draw_landmarks(image, hand_landmarks, mp_hands.HAND_CONNECTIONS)
 
-        # Calculate and display FPS
-        current_time = time.time()
-        fps = 1 / (current_time - previous_time)
+        # Calculate smoothed FPS (guarding against a zero interval)
+        current_time = now()
+        fps = 1 / max(current_time - previous_time, 1e-6)
+        fps_ema = fps if fps_ema is None else (
+            (1 - FPS_SMOOTHING) * fps_ema + FPS_SMOOTHING * fps
+        )
         previous_time = current_time
 
         # Draw FPS counter on image
-        cv2.putText(image, str(int(fps)), (10, 70), 
-                   cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
+        putText(image, str(int(fps_ema)), (10, 70), 
+                cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
 
         # Display the image
-        cv2.imshow("Minimal Hand Tracking", image)
+        imshow("Minimal Hand Tracking", image)
         
         # Exit on 'q' key press
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        if waitKey(1) & 0xFF == ord('q'):
             break
 
     # Clean up
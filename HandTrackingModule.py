@@ -5,12 +5,142 @@ This module provides a class for detecting and tracking hands in real-time video
 using MediaPipe's hand detection solution.
 """
 
-import cv2
-import mediapipe as mp
+import importlib
+import itertools
+import multiprocessing
+import numpy as np
+import queue
 import time
 import math
 
 
+# Frame rate the demo loops aim to keep up with
+TARGET_FPS = 30
+
+# Upper bound on stale frames dropped per read when the backend doesn't
+# report its queue depth (typical webcam queue depth)
+MAX_STALE_FRAMES = 4
+
+# MediaPipe reports a fixed number of landmarks per hand
+NUM_LANDMARKS = 21
+
+# Drawing styles (BGR colours, sizes in pixels)
+POSITION_COLOR = (255, 0, 0)
+POSITION_RADIUS = 7
+SKELETON_COLOR = (224, 224, 224)
+SKELETON_THICKNESS = 2
+JOINT_COLOR = (0, 0, 255)
+JOINT_RADIUS = 3
+DISTANCE_LINE_COLOR = (255, 0, 255)
+DISTANCE_LINE_THICKNESS = 3
+DISTANCE_POINT_COLOR = (255, 0, 0)
+DISTANCE_POINT_RADIUS = 5
+
+
+def _load_mediapipe():
+    """
+    Import MediaPipe on first use.
+    
+    Importing MediaPipe registers its TFLite graphs and dominates this
+    module's import time, so it is deferred until a HandDetector is built.
+    """
+    return importlib.import_module("mediapipe")
+
+
+# OpenCV module once loaded; see _load_cv2()
+_cv2 = None
+
+
+def _load_cv2():
+    """
+    Import OpenCV on first use.
+    
+    Distance-only callers never touch OpenCV, so they avoid its import
+    cost. The module is cached in a global because this runs on every
+    frame, where importlib.import_module() would cost ~10x a global read.
+    """
+    global _cv2
+    if _cv2 is None:
+        _cv2 = importlib.import_module("cv2")
+    return _cv2
+
+
+# Numeric kernels module once loaded; see _load_kernels()
+_kernels = None
+
+
+def _load_kernels():
+    """
+    Import the numeric kernels in HandTrackingModule_fast on first use.
+    
+    That module imports Numba when it is installed, which costs more than
+    everything else this module imports, so it is deferred until a
+    HandDetector is built.
+    """
+    global _kernels
+    if _kernels is None:
+        _kernels = importlib.import_module("HandTrackingModule_fast")
+    return _kernels
+
+
+def __getattr__(name):
+    """
+    Resolve the lazily imported ``mp`` and ``cv2`` module attributes (PEP 562).
+    """
+    if name == "mp":
+        return _load_mediapipe()
+    if name == "cv2":
+        return _load_cv2()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def open_camera(camera_index=0):
+    """
+    Open a camera with the driver-side frame queue kept as short as possible.
+    
+    Args:
+        camera_index (int): Index of the camera to open.
+        
+    Returns:
+        cv2.VideoCapture: The opened capture device.
+    """
+    cv2 = _load_cv2()
+    cap = cv2.VideoCapture(camera_index)
+    # Not every backend honours this, which read_latest_frame() accounts for
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+def read_latest_frame(cap, elapsed, target_fps=TARGET_FPS):
+    """
+    Read the newest frame, skipping frames that queued up during processing.
+    
+    Stale frames are only grabbed, never decoded, so falling behind the
+    camera costs far less than calling cap.read() for every frame. No more
+    frames are skipped than the driver can have queued: grabbing past the
+    queue would block until the camera delivers a new frame.
+    
+    Args:
+        cap (cv2.VideoCapture): Open capture device.
+        elapsed (float): Seconds spent since the previous frame was read.
+        target_fps (float): Frame rate the camera is expected to deliver.
+        
+    Returns:
+        tuple: (success, image) as returned by cap.read().
+    """
+    # Backends that don't report a queue depth return 0 or -1
+    queue_depth = int(cap.get(_load_cv2().CAP_PROP_BUFFERSIZE))
+    max_stale = queue_depth - 1 if queue_depth > 0 else MAX_STALE_FRAMES
+    
+    stale_frames = min(int(elapsed * target_fps), max_stale)
+    for _ in range(stale_frames):
+        cap.grab()
+
+    if not cap.grab():
+        return False, None
+    return cap.retrieve()
+
+
 class HandDetector:
     """
     A class for detecting and tracking hands in video frames using MediaPipe.
@@ -20,7 +150,8 @@ class HandDetector:
     """
     
     def __init__(self, static_image_mode=False, max_hands=2, 
-                 detection_confidence=0.5, tracking_confidence=0.5):
+                 detection_confidence=0.5, tracking_confidence=0.5,
+                 inference_scale=1.0, use_opencl=False):
         """
         Initialize the hand detector with specified parameters.
         
@@ -29,13 +160,24 @@ class HandDetector:
             max_hands (int): Maximum number of hands to detect (1-2).
             detection_confidence (float): Minimum confidence for hand detection (0.0-1.0).
             tracking_confidence (float): Minimum confidence for hand tracking (0.0-1.0).
+            inference_scale (float): Factor the frame is downscaled by before
+                detection (0.0-1.0]. Landmarks are normalized, so positions
+                are still reported in full-frame pixels.
+            use_opencl (bool): Whether to resize and colour-convert frames on
+                an OpenCL device. Ignored when OpenCL is unavailable.
         """
+        if not 0.0 < inference_scale <= 1.0:
+            raise ValueError("inference_scale must be in the range (0.0, 1.0]")
+        
         self.static_image_mode = static_image_mode
         self.max_hands = max_hands
         self.detection_confidence = detection_confidence
         self.tracking_confidence = tracking_confidence
+        self.inference_scale = inference_scale
+        self.use_opencl = use_opencl and _load_cv2().ocl.haveOpenCL()
         
         # Initialize MediaPipe hands solution
+        mp = _load_mediapipe()
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=self.static_image_mode,
@@ -45,6 +187,32 @@ class HandDetector:
         )
         self.mp_draw = mp.solutions.drawing_utils
 
+        # Cache per-frame lookups used when drawing landmarks
+        self._hand_connections = self.mp_hands.HAND_CONNECTIONS
+        self._draw_fn = self.mp_draw.draw_landmarks
+        self._connections_arr = np.array(
+            sorted(self._hand_connections), dtype=np.int32
+        )
+
+        # Reusable RGB buffer so colour conversion doesn't allocate every frame
+        self._rgb_buf = None
+
+        # Reusable [id, x, y] landmark buffer; the id column never changes
+        self._landmark_buf = np.zeros((NUM_LANDMARKS, 3), dtype=np.int32)
+        self._landmark_buf[:, 0] = np.arange(NUM_LANDMARKS)
+
+        # Latest MediaPipe results; None until find_hands() has run
+        self.results = None
+
+        # Normalized coordinates of every hand in the latest results
+        self._lm_cache = np.empty((self.max_hands, NUM_LANDMARKS, 2))
+        self._lm_cache_results = None
+
+        # Pay any JIT compilation cost now rather than on the first frame
+        kernels = _load_kernels()
+        self._landmarks_to_pixels = kernels.landmarks_to_pixels
+        kernels.warm_up()
+
 
     def find_hands(self, image, draw=True):
         """
@@ -64,23 +232,133 @@ class HandDetector:
         if len(image.shape) != 3 or image.shape[2] != 3:
             raise ValueError("Image must be a 3-channel BGR image")
         
-        # Convert BGR to RGB for MediaPipe processing
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        # Downscale and convert BGR to RGB for MediaPipe processing
+        if self.use_opencl:
+            image_rgb = self._to_rgb_opencl(image)
+        else:
+            image_rgb = self._to_rgb(image)
         self.results = self.hands.process(image_rgb)
 
         # Draw hand landmarks if hands are detected
-        if self.results.multi_hand_landmarks:
+        if draw and self.results.multi_hand_landmarks:
             for hand_landmarks in self.results.multi_hand_landmarks:
-                if draw:
-                    self.mp_draw.draw_landmarks(
-                        image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                    )
+                self._draw_fn(image, hand_landmarks, self._hand_connections)
 
         return image
     
-    def find_position(self, image, hand_number=0, draw=True):
+    def _to_rgb(self, image):
         """
-        Extract landmark positions for a specific hand.
+        Prepare the RGB inference frame on the CPU using the cached buffer.
+        """
+        cv2 = _load_cv2()
+        
+        # Shrink the frame first so every later step touches fewer pixels
+        inference_image = image
+        if self.inference_scale != 1.0:
+            inference_image = cv2.resize(
+                image, None, fx=self.inference_scale, fy=self.inference_scale,
+                interpolation=cv2.INTER_AREA
+            )
+        
+        # Convert BGR to RGB for MediaPipe processing into the cached buffer
+        buf = self._rgb_buf
+        if (buf is None or buf.shape != inference_image.shape
+                or buf.dtype != inference_image.dtype):
+            self._rgb_buf = np.empty_like(inference_image)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(inference_image, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+        # Read-only input lets MediaPipe use the buffer without copying it
+        self._rgb_buf.flags.writeable = False
+        return self._rgb_buf
+    
+    def _to_rgb_opencl(self, image):
+        """
+        Prepare the RGB inference frame on the OpenCL device.
+        
+        The frame is uploaded once, resized and converted on the device, and
+        downloaded once for MediaPipe, keeping that work off the CPU cores
+        MediaPipe inference runs on.
+        """
+        cv2 = _load_cv2()
+        frame = cv2.UMat(image)
+        if self.inference_scale != 1.0:
+            frame = cv2.resize(
+                frame, None, fx=self.inference_scale, fy=self.inference_scale,
+                interpolation=cv2.INTER_AREA
+            )
+        
+        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).get()
+        image_rgb.flags.writeable = False
+        return image_rgb
+    
+    def _build_lm_cache(self):
+        """
+        Read the normalized (x, y) coordinates of every detected hand.
+        
+        The (hands, 21, 2) cache is tied to the current results object, so
+        querying several hands of one frame reads the landmarks only once.
+        """
+        hands = self.results.multi_hand_landmarks
+        if len(hands) > len(self._lm_cache):
+            self._lm_cache = np.empty((len(hands), NUM_LANDMARKS, 2))
+        
+        coordinates = itertools.chain.from_iterable(
+            (landmark.x, landmark.y)
+            for hand_landmarks in hands
+            for landmark in hand_landmarks.landmark
+        )
+        self._lm_cache[:len(hands)] = np.fromiter(
+            coordinates, dtype=np.float64, count=2 * NUM_LANDMARKS * len(hands)
+        ).reshape(len(hands), NUM_LANDMARKS, 2)
+        
+        # Keep a reference rather than an id() so a recycled object address
+        # can never be mistaken for the cached results
+        self._lm_cache_results = self.results
+    
+    def _fill_landmark_buf(self, image, hand_number):
+        """
+        Write pixel positions for a hand into the reusable landmark buffer.
+        
+        Returns:
+            bool: False if the requested hand was not detected.
+        """
+        # Check if results exist and hands are detected
+        if self.results is None or not self.results.multi_hand_landmarks:
+            return False
+        
+        # Check if requested hand number exists
+        if hand_number >= len(self.results.multi_hand_landmarks):
+            return False
+        
+        # Convert every hand of this result once, however many are queried
+        if self._lm_cache_results is not self.results:
+            self._build_lm_cache()
+        num_hands = len(self.results.multi_hand_landmarks)
+        normalized = self._lm_cache[:num_hands][hand_number]
+        height, width = image.shape[:2]
+
+        # Scale to pixel coordinates straight into the int32 columns
+        self._landmarks_to_pixels(normalized, width, height, self._landmark_buf)
+        return True
+    
+    def _draw_positions(self, image):
+        """
+        Draw a circle at every landmark currently held in the landmark buffer.
+        
+        Kept separate from the extraction so the no-draw path never touches
+        the drawing loop at all.
+        """
+        cv2 = _load_cv2()
+        for center_x, center_y in self._landmark_buf[:, 1:].tolist():
+            cv2.circle(image, (center_x, center_y), POSITION_RADIUS, POSITION_COLOR, cv2.FILLED)
+    
+    def find_landmarks(self, image, hand_number=0, draw=True):
+        """
+        Extract landmark pixel positions for a specific hand as an array.
+        
+        Row i holds the (x, y) position of landmark i, so landmark constants
+        such as THUMB_TIP index the array directly.
         
         Args:
             image: Input image frame.
@@ -88,49 +366,96 @@ class HandDetector:
             draw (bool): Whether to draw circles at landmark positions.
             
         Returns:
-            list: List of landmark positions [[id, x, y], ...].
+            numpy.ndarray: Array of shape (21, 2) and dtype int32, or shape
+            (0, 2) if the requested hand was not detected.
         """
-        landmark_list = []
+        if not self._fill_landmark_buf(image, hand_number):
+            return np.empty((0, 2), dtype=np.int32)
 
-        # Check if results exist and hands are detected
-        if not hasattr(self, 'results') or not self.results.multi_hand_landmarks:
-            return landmark_list
+        # Copy out of the shared buffer so results survive the next call
+        pixels = self._landmark_buf[:, 1:].copy()
+
+        # Draw circles at landmark positions if requested
+        if draw:
+            self._draw_positions(image)
+
+        return pixels
+    
+    def draw_landmarks(self, image, landmarks):
+        """
+        Draw a hand skeleton from an array returned by find_landmarks().
         
-        # Check if requested hand number exists
-        if hand_number >= len(self.results.multi_hand_landmarks):
-            return landmark_list
+        Much cheaper than find_hands(draw=True): all connections are drawn
+        with a single cv2.polylines call instead of one call per segment.
         
-        # Get the specified hand
-        hand_landmarks = self.results.multi_hand_landmarks[hand_number]
-
-        # Extract landmark positions
-        for landmark_id, landmark in enumerate(hand_landmarks.landmark):
-            height, width, channels = image.shape
-            # Convert normalized coordinates to pixel coordinates
-            center_x = int(landmark.x * width)
-            center_y = int(landmark.y * height)
+        Args:
+            image: Image frame to draw on.
+            landmarks (numpy.ndarray): Landmark array of shape (21, 2).
             
-            landmark_list.append([landmark_id, center_x, center_y])
+        Returns:
+            image: Image with the hand skeleton drawn.
+        """
+        if len(landmarks) == 0:
+            return image
+        
+        cv2 = _load_cv2()
+        
+        # Index the landmarks with the edge list to get (E, 2, 2) segments
+        segments = landmarks[self._connections_arr]
+        cv2.polylines(image, segments, False, SKELETON_COLOR, SKELETON_THICKNESS)
+        
+        for center_x, center_y in landmarks.tolist():
+            cv2.circle(image, (center_x, center_y), JOINT_RADIUS, JOINT_COLOR, cv2.FILLED)
+        
+        return image
+    
+    def find_position(self, image, hand_number=0, draw=True):
+        """
+        Extract landmark positions for a specific hand.
+        
+        Args:
+            image: Input image frame.
+            hand_number (int): Index of the hand to track (0 for first hand).
+            draw (bool): Whether to draw circles at landmark positions.
             
-            # Draw circle at landmark position if requested
-            if draw:
-                cv2.circle(image, (center_x, center_y), 7, (255, 0, 0), cv2.FILLED)
+        Returns:
+            list: List of landmark positions [[id, x, y], ...].
+        """
+        if not self._fill_landmark_buf(image, hand_number):
+            return []
+        
+        # One conversion builds every [id, x, y] entry at once
+        landmark_list = self._landmark_buf.tolist()
+
+        # Draw circles at landmark positions if requested
+        if draw:
+            self._draw_positions(image)
 
         return landmark_list
     
-    def find_distance(self, point1, point2, image=None, draw=True):
+    @staticmethod
+    def find_distance(point1, point2, image=None, draw=True):
         """
         Calculate Euclidean distance between two points and optionally draw a line.
         
+        Accepts either point format; callers whose format is fixed can use
+        find_distance_xy() or find_distance_landmark() to skip the checks.
+        
         Args:
-            point1 (list): First point [id, x, y] or [x, y].
-            point2 (list): Second point [id, x, y] or [x, y].
+            point1 (list or numpy.ndarray): First point [id, x, y] or [x, y].
+            point2 (list or numpy.ndarray): Second point [id, x, y] or [x, y].
             image: Input image frame (optional, for drawing).
             draw (bool): Whether to draw line between points.
             
         Returns:
             tuple: (distance, image, [x1, y1, x2, y2])
         """
+        # Rows of a find_landmarks() array become plain Python coordinates
+        if isinstance(point1, np.ndarray):
+            point1 = point1.tolist()
+        if isinstance(point2, np.ndarray):
+            point2 = point2.tolist()
+        
         # Extract coordinates (handle both [id, x, y] and [x, y] formats)
         if len(point1) == 3:
             x1, y1 = point1[1], point1[2]
@@ -142,14 +467,290 @@ class HandDetector:
         else:
             x2, y2 = point2[0], point2[1]
         
+        return HandDetector._find_distance_impl(x1, y1, x2, y2, image, draw)
+    
+    @staticmethod
+    def find_distance_xy(point1, point2, image=None, draw=True):
+        """
+        Calculate the distance between two [x, y] points.
+        
+        Args:
+            point1 (list): First point [x, y].
+            point2 (list): Second point [x, y].
+            image: Input image frame (optional, for drawing).
+            draw (bool): Whether to draw line between points.
+            
+        Returns:
+            tuple: (distance, image, [x1, y1, x2, y2])
+        """
+        return HandDetector._find_distance_impl(
+            point1[0], point1[1], point2[0], point2[1], image, draw
+        )
+    
+    @staticmethod
+    def find_distance_landmark(landmark1, landmark2, image=None, draw=True):
+        """
+        Calculate the distance between two [id, x, y] find_position() entries.
+        
+        Args:
+            landmark1 (list): First landmark [id, x, y].
+            landmark2 (list): Second landmark [id, x, y].
+            image: Input image frame (optional, for drawing).
+            draw (bool): Whether to draw line between points.
+            
+        Returns:
+            tuple: (distance, image, [x1, y1, x2, y2])
+        """
+        return HandDetector._find_distance_impl(
+            landmark1[1], landmark1[2], landmark2[1], landmark2[2], image, draw
+        )
+    
+    @staticmethod
+    def _find_distance_impl(x1, y1, x2, y2, image, draw):
+        """
+        Compute the distance and draw it, shared by the find_distance variants.
+        """
         # Calculate Euclidean distance
-        distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        distance = math.hypot(x2 - x1, y2 - y1)
         
         # Draw line between points if requested and image provided
         if draw and image is not None:
-            cv2.line(image, (x1, y1), (x2, y2), (255, 0, 255), 3)
-            cv2.circle(image, (x1, y1), 5, (255, 0, 0), cv2.FILLED)
-            cv2.circle(image, (x2, y2), 5, (255, 0, 0), cv2.FILLED)
+            cv2 = _load_cv2()
+            cv2.line(image, (x1, y1), (x2, y2), DISTANCE_LINE_COLOR, DISTANCE_LINE_THICKNESS)
+            cv2.circle(image, (x1, y1), DISTANCE_POINT_RADIUS, DISTANCE_POINT_COLOR, cv2.FILLED)
+            cv2.circle(image, (x2, y2), DISTANCE_POINT_RADIUS, DISTANCE_POINT_COLOR, cv2.FILLED)
         
         return distance, image, [x1, y1, x2, y2]
- 
+    
+    @staticmethod
+    def find_distances(points_a, points_b):
+        """
+        Calculate distances between many point pairs in one vectorized pass.
+        
+        Args:
+            points_a (array-like): N points as rows of [x, y] or [id, x, y].
+            points_b (array-like): N points matching points_a row by row.
+            
+        Returns:
+            numpy.ndarray: Float64 array of the N distances.
+        """
+        # The last two columns are (x, y) in both point formats
+        a = np.asarray(points_a, dtype=np.float64)[:, -2:]
+        b = np.asarray(points_b, dtype=np.float64)[:, -2:]
+        
+        diff = a - b
+        # Row-wise dot product squares and sums without a temporary array
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    
+    @staticmethod
+    def find_all_distances(landmark_list):
+        """
+        Calculate the distance between every pair of points.
+        
+        Args:
+            landmark_list (array-like): N points as rows of [x, y] or
+                [id, x, y], e.g. the output of find_position() or
+                find_landmarks().
+            
+        Returns:
+            numpy.ndarray: Symmetric (N, N) float64 matrix where entry
+            [i, j] is the distance between points i and j.
+        """
+        # The last two columns are (x, y) in both point formats
+        points = np.asarray(landmark_list, dtype=np.float64)[:, -2:]
+        
+        # Broadcast to an (N, N, 2) offset array; for 21 landmarks it is tiny
+        diff = points[:, None, :] - points[None, :, :]
+        return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+    
+    @staticmethod
+    def squared_distance(point1, point2):
+        """
+        Calculate the squared Euclidean distance between two points.
+        
+        Cheaper than find_distance() when the result is only compared
+        against a threshold: compare against threshold**2 instead.
+        
+        Args:
+            point1 (list or numpy.ndarray): First point [id, x, y] or [x, y].
+            point2 (list or numpy.ndarray): Second point [id, x, y] or [x, y].
+            
+        Returns:
+            float: Squared distance between the points.
+        """
+        # The last two entries are (x, y) in both point formats
+        dx = point2[-2] - point1[-2]
+        dy = point2[-1] - point1[-1]
+        return dx * dx + dy * dy
+
+
+def put_latest(item_queue, item):
+    """
+    Put an item on a single-slot queue, replacing any item still waiting.
+    
+    Args:
+        item_queue: Queue created with maxsize=1.
+        item: Item to publish.
+    """
+    try:
+        item_queue.put_nowait(item)
+    except queue.Full:
+        # Drop the stale item so the consumer always sees the newest one
+        try:
+            item_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            item_queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+
+def capture_worker(frame_queue, stop_event, camera_index=0):
+    """
+    Read camera frames and publish the newest one until stopped.
+    
+    Publishes None when the camera stops delivering frames.
+    
+    Args:
+        frame_queue: Single-slot queue receiving BGR frames.
+        stop_event: Event that signals the worker to exit.
+        camera_index (int): Index of the camera to open.
+    """
+    cap = open_camera(camera_index)
+    frame_read_time = time.monotonic()
+    
+    while not stop_event.is_set():
+        success, image = read_latest_frame(cap, time.monotonic() - frame_read_time)
+        frame_read_time = time.monotonic()
+        if not success:
+            break
+        put_latest(frame_queue, image)
+    
+    cap.release()
+    put_latest(frame_queue, None)
+
+
+def inference_worker(frame_queue, result_queue, stop_event, draw=True,
+                     detector_kwargs=None):
+    """
+    Run hand detection on published frames until stopped.
+    
+    The HandDetector is created here, inside the worker process, because
+    MediaPipe graphs cannot be shared between processes. Publishes
+    (image, landmarks) tuples, or None once the frame source ends.
+    
+    Args:
+        frame_queue: Single-slot queue of BGR frames (None ends the stream).
+        result_queue: Single-slot queue receiving (image, landmarks).
+        stop_event: Event that signals the worker to exit.
+        draw (bool): Whether to draw the hand skeleton on each image.
+        detector_kwargs (dict): Keyword arguments for HandDetector.
+    """
+    detector = HandDetector(**(detector_kwargs or {}))
+    
+    while not stop_event.is_set():
+        try:
+            image = frame_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        
+        if image is None:
+            break
+        
+        image = detector.find_hands(image, draw=False)
+        landmarks = detector.find_landmarks(image, draw=False)
+        if draw:
+            detector.draw_landmarks(image, landmarks)
+        put_latest(result_queue, (image, landmarks))
+    
+    put_latest(result_queue, None)
+
+
+class HandTrackingPipeline:
+    """
+    Run camera capture and hand detection in separate processes.
+    
+    Capture keeps running at camera rate while MediaPipe inference runs in
+    its own process, so a slow inference frame never stalls capture and the
+    caller's display loop only waits on finished results. Separate processes
+    rather than threads keep the workers from contending for the GIL.
+    """
+    
+    def __init__(self, camera_index=0, draw=True, **detector_kwargs):
+        """
+        Initialize the pipeline without starting any processes.
+        
+        Args:
+            camera_index (int): Index of the camera to open.
+            draw (bool): Whether to draw the hand skeleton on each image.
+            **detector_kwargs: Keyword arguments for HandDetector.
+        """
+        self.camera_index = camera_index
+        self.draw = draw
+        self.detector_kwargs = detector_kwargs
+        
+        self._frame_queue = multiprocessing.Queue(maxsize=1)
+        self._result_queue = multiprocessing.Queue(maxsize=1)
+        self._stop_event = multiprocessing.Event()
+        self._processes = []
+    
+    def start(self):
+        """
+        Start the capture and inference processes.
+        """
+        self._processes = [
+            multiprocessing.Process(
+                target=capture_worker,
+                args=(self._frame_queue, self._stop_event, self.camera_index),
+                daemon=True
+            ),
+            multiprocessing.Process(
+                target=inference_worker,
+                args=(self._frame_queue, self._result_queue, self._stop_event,
+                      self.draw, self.detector_kwargs),
+                daemon=True
+            ),
+        ]
+        for process in self._processes:
+            process.start()
+    
+    def read(self):
+        """
+        Wait for the next detection result.
+        
+        Returns:
+            tuple: (image, landmarks) for the newest processed frame, or None
+            if the camera failed or a worker exited.
+        """
+        while True:
+            try:
+                return self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                if not all(process.is_alive() for process in self._processes):
+                    return None
+    
+    def stop(self, timeout=2.0):
+        """
+        Stop both worker processes.
+        
+        Args:
+            timeout (float): Seconds to wait before terminating the workers.
+        """
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        
+        for process in self._processes:
+            # Keep draining so workers blocked flushing a frame can exit
+            while process.is_alive() and time.monotonic() < deadline:
+                for item_queue in (self._frame_queue, self._result_queue):
+                    try:
+                        item_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                process.join(0.05)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        
+        self._processes = []
@@ -0,0 +1,95 @@
+"""
+Compiled numeric kernels for the Hand Tracking Module.
+
+Kernels are JIT-compiled with Numba when it is installed and fall back to
+equivalent vectorized NumPy implementations otherwise, so Numba remains an
+optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def pairwise_distances(points, pairs):
+        """
+        Calculate distances between selected pairs of landmark points.
+
+        Args:
+            points (numpy.ndarray): Point array of shape (N, 2).
+            pairs (numpy.ndarray): Index pairs of shape (P, 2), dtype intp.
+
+        Returns:
+            numpy.ndarray: Float64 array of the P pair distances.
+        """
+        distances = np.empty(pairs.shape[0], np.float64)
+        for k in range(pairs.shape[0]):
+            dx = float(points[pairs[k, 1], 0] - points[pairs[k, 0], 0])
+            dy = float(points[pairs[k, 1], 1] - points[pairs[k, 0], 1])
+            distances[k] = np.sqrt(dx * dx + dy * dy)
+        return distances
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def landmarks_to_pixels(normalized, width, height, out):
+        """
+        Scale normalized landmarks into the x and y columns of a pixel buffer.
+
+        Args:
+            normalized (numpy.ndarray): Float64 (x, y) array of shape (21, 2).
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            out (numpy.ndarray): Int32 [id, x, y] buffer of shape (21, 3);
+                the id column is left untouched.
+        """
+        for i in range(normalized.shape[0]):
+            # Float to int conversion truncates toward zero like int()
+            out[i, 1] = np.int32(normalized[i, 0] * width)
+            out[i, 2] = np.int32(normalized[i, 1] * height)
+else:
+    def pairwise_distances(points, pairs):
+        """
+        Calculate distances between selected pairs of landmark points.
+
+        Args:
+            points (numpy.ndarray): Point array of shape (N, 2).
+            pairs (numpy.ndarray): Index pairs of shape (P, 2), dtype intp.
+
+        Returns:
+            numpy.ndarray: Float64 array of the P pair distances.
+        """
+        offsets = points[pairs[:, 1]] - points[pairs[:, 0]]
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+
+    def landmarks_to_pixels(normalized, width, height, out):
+        """
+        Scale normalized landmarks into the x and y columns of a pixel buffer.
+
+        Args:
+            normalized (numpy.ndarray): Float64 (x, y) array of shape (21, 2).
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            out (numpy.ndarray): Int32 [id, x, y] buffer of shape (21, 3);
+                the id column is left untouched.
+        """
+        # Unsafe casting into the int32 columns truncates like int()
+        np.multiply(normalized, (width, height), out=out[:, 1:], casting='unsafe')
+
+
+def warm_up():
+    """
+    Compile the kernels for the landmark dtypes used by HandDetector.
+
+    Calling this at startup moves Numba's one-off compilation cost out of
+    the first processed frame. Without Numba it is just a cheap call.
+    """
+    pairwise_distances(
+        np.zeros((21, 2), dtype=np.int32), np.zeros((1, 2), dtype=np.intp)
+    )
+    landmarks_to_pixels(
+        np.zeros((21, 2)), 640, 480, np.zeros((21, 3), dtype=np.int32)
+    )
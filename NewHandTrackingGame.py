@@ -6,7 +6,6 @@ hand tracking applications and games.
 """
 
 import cv2
-import mediapipe as mp
 import time
 import HandTrackingModule as htm
 
@@ -29,6 +28,9 @@ PINKY_MCP = 17
 # Total number of landmarks available
 TOTAL_LANDMARKS = 21
 
+# Weight of the newest frame in the smoothed FPS reading
+FPS_SMOOTHING = 0.1
+
 
 def print_landmark_info():
     """
@@ -53,8 +55,8 @@ def print_landmark_info():
     print(f"  RING_FINGER_MCP = {RING_FINGER_MCP}")
     print(f"  PINKY_MCP = {PINKY_MCP}")
     print("\nUsage example:")
-    print("  landmark_list[THUMB_TIP]  # Gets thumb tip position")
-    print("  landmark_list[INDEX_FINGER_TIP]  # Gets index finger tip position")
+    print("  landmarks[THUMB_TIP]  # Gets thumb tip (x, y) position")
+    print("  landmarks[INDEX_FINGER_TIP]  # Gets index finger tip (x, y) position")
 
 
 def main():
@@ -69,29 +71,34 @@ def main():
     print("\nStarting hand tracking game...")
     print("Press 'q' to quit\n")
     
+    # Bind per-frame calls to locals to skip repeated attribute lookups
+    putText, imshow, waitKey = cv2.putText, cv2.imshow, cv2.waitKey
+    now = time.monotonic
+    
     # Initialize timing variables for FPS calculation
-    previous_time = 0
+    previous_time = now()
     current_time = 0
+    fps_ema = None
     
-    # Initialize camera capture
-    cap = cv2.VideoCapture(0)
-    
-    # Initialize hand detector
-    detector = htm.HandDetector()
+    # Run camera capture and hand detection in their own processes so a
+    # slow inference frame never stalls capture or this display loop.
+    # The game only follows the first hand, so don't track a second one.
+    pipeline = htm.HandTrackingPipeline(
+        camera_index=0, draw=True, max_hands=1, inference_scale=0.5
+    )
+    pipeline.start()
+    read_result = pipeline.read
 
     while True:
-        # Read frame from camera
-        success, image = cap.read()
-        if not success:
+        # Wait for the newest processed frame and its landmarks
+        result = read_result()
+        if result is None:
             print("Failed to read from camera")
             break
-            
-        # Detect hands without drawing landmarks (for game performance)
-        image = detector.find_hands(image, draw=True)
-        landmark_list = detector.find_position(image, draw=False)
+        image, landmarks = result
         
         # Process hand landmarks if detected
-        if len(landmark_list) != 0:
+        if len(landmarks) != 0:
             # ===== EASY LANDMARK SELECTION =====
             # Change the landmark below to track different finger positions
             # Available: THUMB_TIP, INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, 
@@ -99,31 +106,34 @@ def main():
             # Total landmarks: 0-20 (21 landmarks)
             
             selected_landmark = THUMB_TIP  # Change this to track different landmarks
-            print(f"Selected landmark position: {landmark_list[selected_landmark]}")
+            print(f"Selected landmark position: {landmarks[selected_landmark].tolist()}")
             
             # Example: Track multiple landmarks simultaneously
-            # print(f"Thumb tip: {landmark_list[THUMB_TIP]}")
-            # print(f"Index finger tip: {landmark_list[INDEX_FINGER_TIP]}")
-            # print(f"Middle finger tip: {landmark_list[MIDDLE_FINGER_TIP]}")
-
-        # Calculate and display FPS
-        current_time = time.time()
-        fps = 1 / (current_time - previous_time)
+            # print(f"Thumb tip: {landmarks[THUMB_TIP].tolist()}")
+            # print(f"Index finger tip: {landmarks[INDEX_FINGER_TIP].tolist()}")
+            # print(f"Middle finger tip: {landmarks[MIDDLE_FINGER_TIP].tolist()}")
+
+        # Calculate smoothed FPS (guarding against a zero interval)
+        current_time = now()
+        fps = 1 / max(current_time - previous_time, 1e-6)
+        fps_ema = fps if fps_ema is None else (
+            (1 - FPS_SMOOTHING) * fps_ema + FPS_SMOOTHING * fps
+        )
         previous_time = current_time
 
         # Draw FPS counter on image
-        cv2.putText(image, str(int(fps)), (10, 70), 
-                   cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
+        putText(image, str(int(fps_ema)), (10, 70), 
+                cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
 
         # Display the image
-        cv2.imshow("Hand Tracking Game", image)
+        imshow("Hand Tracking Game", image)
         
         # Exit on 'q' key press
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        if waitKey(1) & 0xFF == ord('q'):
             break
 
     # Clean up
-    cap.release()
+    pipeline.stop()
     cv2.destroyAllWindows()
 
 
@@ -4,3 +4,22 @@ Test package for HandTracking project.
 This package contains all unit tests for the HandTracking project,
 organized by functionality and component.
 """
+
+import importlib.util
+import sys
+from unittest import mock
+
+
+def load_kernels_without_numba():
+    """
+    Load a fresh copy of HandTrackingModule_fast with Numba hidden.
+    
+    Returns:
+        module: The kernels module as it behaves when Numba is not
+        installed, i.e. using the NumPy fallbacks.
+    """
+    spec = importlib.util.find_spec("HandTrackingModule_fast")
+    fallback = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {'numba': None}):
+        spec.loader.exec_module(fallback)
+    return fallback
@@ -9,6 +9,40 @@ import unittest
 import math
 import numpy as np
 import HandTrackingModule as htm
+import HandTrackingModule_fast as htm_fast
+from tests import load_kernels_without_numba
+
+
+# Shared read-only fixture; tests that draw work on a copy
+_BLANK_IMAGE = np.zeros((480, 640, 3), dtype=np.uint8)
+_BLANK_IMAGE.setflags(write=False)
+
+
+def _close(first, second, places=5):
+    """
+    Check two numbers agree to the given decimal places.
+    
+    Same tolerance as assertAlmostEqual(places=...), without its
+    per-call dispatch through TestCase.
+    """
+    return abs(first - second) < 0.5 * 10 ** -places
+
+
+# (name, point1, point2, expected distance, expected [x1, y1, x2, y2])
+_DISTANCE_CASES = (
+    # 3-4-5 triangle
+    ("basic", [0, 0], [3, 4], 5.0, [0, 0, 3, 4]),
+    # Thumb tip to index finger tip in [id, x, y] format
+    ("landmark format", [4, 100, 200], [8, 150, 180],
+     math.sqrt((150 - 100)**2 + (180 - 200)**2), [100, 200, 150, 180]),
+    ("negative coordinates", [-10, -20], [10, 20],
+     math.sqrt((10 - (-10))**2 + (20 - (-20))**2), [-10, -20, 10, 20]),
+    ("floating point coordinates", [1.5, 2.5], [4.5, 6.5],
+     math.sqrt((4.5 - 1.5)**2 + (6.5 - 2.5)**2), [1.5, 2.5, 4.5, 6.5]),
+    # [id, x, y] format against [x, y] format
+    ("mixed point formats", [4, 100, 200], [150, 180],
+     math.sqrt((150 - 100)**2 + (180 - 200)**2), [100, 200, 150, 180]),
+)
 
 
 class TestDistanceCalculation(unittest.TestCase):
@@ -16,86 +50,71 @@ class TestDistanceCalculation(unittest.TestCase):
     Test cases specifically for distance calculation functionality.
     """
     
-    def setUp(self):
+    def test_distance_cases(self):
         """
-        Set up test fixtures before each test method.
+        Test find_distance against a table of point formats and coordinates.
         """
-        self.detector = htm.HandDetector()
-    
-    def test_basic_distance_calculation(self):
-        """
-        Test basic distance calculation with simple coordinates.
-        """
-        point1 = [0, 0]
-        point2 = [3, 4]
-        
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
-        
-        # Test distance calculation (3-4-5 triangle)
-        self.assertAlmostEqual(distance, 5.0, places=5)
-        self.assertEqual(coords, [0, 0, 3, 4])
-    
-    def test_landmark_format_distance(self):
-        """
-        Test distance calculation with landmark format [id, x, y].
-        """
-        point1 = [4, 100, 200]  # Thumb tip
-        point2 = [8, 150, 180]  # Index finger tip
-        
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
-        
-        expected_distance = math.sqrt((150 - 100)**2 + (180 - 200)**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
-        self.assertEqual(coords, [100, 200, 150, 180])
+        for name, point1, point2, expected_distance, expected_coords in _DISTANCE_CASES:
+            with self.subTest(name):
+                distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
+                
+                self.assertTrue(_close(distance, expected_distance), (distance, expected_distance))
+                self.assertEqual(coords, expected_coords)
     
     def test_zero_distance(self):
         """
         Test distance calculation when points are identical.
         """
         point = [50, 100]
-        distance, _, coords = self.detector.find_distance(point, point, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point, point, None, False)
         
         self.assertEqual(distance, 0.0)
         self.assertEqual(coords, [50, 100, 50, 100])
     
-    def test_negative_coordinates(self):
+    def test_ndarray_point_format(self):
         """
-        Test distance calculation with negative coordinates.
+        Test distance calculation with rows of a find_landmarks() array.
         """
-        point1 = [-10, -20]
-        point2 = [10, 20]
+        landmarks = np.array([[100, 200], [150, 180]], dtype=np.int32)
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(
+            landmarks[0], landmarks[1], None, False
+        )
         
-        expected_distance = math.sqrt((10 - (-10))**2 + (20 - (-20))**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
-        self.assertEqual(coords, [-10, -20, 10, 20])
+        expected_distance = math.sqrt((150 - 100)**2 + (180 - 200)**2)
+        self.assertTrue(_close(distance, expected_distance), (distance, expected_distance))
+        self.assertEqual(coords, [100, 200, 150, 180])
     
-    def test_floating_point_coordinates(self):
+    def test_specialized_distance_variants(self):
         """
-        Test distance calculation with floating point coordinates.
+        Test find_distance_xy and find_distance_landmark match find_distance.
         """
-        point1 = [1.5, 2.5]
-        point2 = [4.5, 6.5]
+        landmark1 = [4, 100, 200]
+        landmark2 = [8, 150, 180]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        expected = htm.HandDetector.find_distance(landmark1, landmark2, None, False)
         
-        expected_distance = math.sqrt((4.5 - 1.5)**2 + (6.5 - 2.5)**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
-        self.assertEqual(coords, [1.5, 2.5, 4.5, 6.5])
+        self.assertEqual(
+            htm.HandDetector.find_distance_landmark(landmark1, landmark2, None, False),
+            expected
+        )
+        self.assertEqual(
+            htm.HandDetector.find_distance_xy(landmark1[1:], landmark2[1:], None, False),
+            expected
+        )
     
-    def test_mixed_point_formats(self):
+    def test_squared_distance(self):
         """
-        Test distance calculation with mixed point formats.
+        Test squared distance matches find_distance squared for both point formats.
         """
         point1 = [4, 100, 200]  # [id, x, y] format
         point2 = [150, 180]      # [x, y] format
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, _ = htm.HandDetector.find_distance(point1, point2, None, False)
+        squared = htm.HandDetector.squared_distance(point1, point2)
         
-        expected_distance = math.sqrt((150 - 100)**2 + (180 - 200)**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
-        self.assertEqual(coords, [100, 200, 150, 180])
+        self.assertEqual(squared, (150 - 100)**2 + (180 - 200)**2)
+        self.assertTrue(_close(squared, distance**2), (squared, distance**2))
     
     def test_very_small_distance(self):
         """
@@ -104,10 +123,10 @@ class TestDistanceCalculation(unittest.TestCase):
         point1 = [0.0, 0.0]
         point2 = [0.001, 0.001]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt(0.001**2 + 0.001**2)
-        self.assertAlmostEqual(distance, expected_distance, places=10)
+        self.assertTrue(_close(distance, expected_distance, places=10), (distance, expected_distance))
     
     def test_very_large_distance(self):
         """
@@ -116,21 +135,21 @@ class TestDistanceCalculation(unittest.TestCase):
         point1 = [0, 0]
         point2 = [1000000, 1000000]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt(1000000**2 + 1000000**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
+        self.assertTrue(_close(distance, expected_distance), (distance, expected_distance))
     
     def test_distance_with_image_drawing(self):
         """
         Test distance calculation with image drawing.
         """
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_image = _BLANK_IMAGE.copy()
         
         point1 = [100, 200]
         point2 = [300, 400]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, mock_image, True
         )
         
@@ -140,19 +159,19 @@ class TestDistanceCalculation(unittest.TestCase):
         
         # Test distance calculation
         expected_distance = math.sqrt((300 - 100)**2 + (400 - 200)**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
+        self.assertTrue(_close(distance, expected_distance), (distance, expected_distance))
         self.assertEqual(coords, [100, 200, 300, 400])
     
     def test_distance_without_drawing(self):
         """
         Test distance calculation without drawing.
         """
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_image = _BLANK_IMAGE
         
         point1 = [50, 75]
         point2 = [150, 175]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, mock_image, False
         )
         
@@ -161,7 +180,7 @@ class TestDistanceCalculation(unittest.TestCase):
         
         # Test distance calculation
         expected_distance = math.sqrt((150 - 50)**2 + (175 - 75)**2)
-        self.assertAlmostEqual(distance, expected_distance, places=5)
+        self.assertTrue(_close(distance, expected_distance), (distance, expected_distance))
     
     def test_distance_no_image(self):
         """
@@ -170,16 +189,83 @@ class TestDistanceCalculation(unittest.TestCase):
         point1 = [0, 0]
         point2 = [5, 12]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, None, True
         )
         
         # Test distance calculation (5-12-13 triangle)
-        self.assertAlmostEqual(distance, 13.0, places=5)
+        self.assertTrue(_close(distance, 13.0), (distance, 13.0))
         
         # Test that no image is returned
         self.assertIsNone(returned_image)
         self.assertEqual(coords, [0, 0, 5, 12])
+    
+    def test_find_distances_batch(self):
+        """
+        Test batched distances match find_distance for each pair and format.
+        """
+        points_a = [[0, 0], [4, 100, 200], [-10, -20], [1.5, 2.5]]
+        points_b = [[3, 4], [8, 150, 180], [10, 20], [4.5, 6.5]]
+        
+        # Mixed row lengths are normalized to [x, y] before batching
+        distances = htm.HandDetector.find_distances(
+            np.array([p[-2:] for p in points_a]), np.array([p[-2:] for p in points_b])
+        )
+        
+        self.assertEqual(distances.shape, (4,))
+        for point1, point2, distance in zip(points_a, points_b, distances.tolist()):
+            expected, _, _ = htm.HandDetector.find_distance(point1, point2, None, False)
+            self.assertTrue(_close(distance, expected), (distance, expected))
+    
+    def test_find_distances_landmark_rows(self):
+        """
+        Test batched distances accept [id, x, y] rows and a single pair.
+        """
+        distances = htm.HandDetector.find_distances([[4, 0, 0]], [[8, 5, 12]])
+        
+        self.assertEqual(distances.shape, (1,))
+        self.assertTrue(_close(distances[0], 13.0), (distances[0], 13.0))
+    
+    def test_find_all_distances_match_find_distance(self):
+        """
+        Test every entry of the distance matrix agrees with find_distance.
+        """
+        landmark_list = [[i, 10 * i, (i * 37) % 480] for i in range(21)]
+        
+        matrix = htm.HandDetector.find_all_distances(landmark_list)
+        
+        self.assertEqual(matrix.shape, (21, 21))
+        for i, point1 in enumerate(landmark_list):
+            for j, point2 in enumerate(landmark_list):
+                expected, _, _ = htm.HandDetector.find_distance(point1, point2, None, False)
+                self.assertTrue(_close(matrix[i, j], expected), (i, j, matrix[i, j], expected))
+    
+    def test_pairwise_distances_match_find_distance(self):
+        """
+        Test the batched pair-distance kernel agrees with find_distance.
+        """
+        landmarks = np.array([[0, 0], [3, 4], [100, 200], [150, 180]], dtype=np.int32)
+        pairs = np.array([[0, 1], [2, 3], [3, 0], [1, 1]], dtype=np.intp)
+        
+        distances = htm_fast.pairwise_distances(landmarks, pairs)
+        
+        self.assertEqual(distances.shape, (4,))
+        for (a, b), distance in zip(pairs.tolist(), distances.tolist()):
+            expected, _, _ = htm.HandDetector.find_distance(landmarks[a], landmarks[b], None, False)
+            self.assertTrue(_close(distance, expected), (distance, expected))
+    
+    def test_pairwise_distances_numpy_fallback(self):
+        """
+        Test the NumPy fallback used when Numba is not installed.
+        """
+        landmarks = np.array([[0, 0], [5, 12]], dtype=np.int32)
+        pairs = np.array([[0, 1]], dtype=np.intp)
+        
+        fallback = load_kernels_without_numba()
+        
+        self.assertIsNone(fallback.njit)
+        distance = float(fallback.pairwise_distances(landmarks, pairs)[0])
+        self.assertTrue(_close(distance, 13.0), (distance, 13.0))
 
 
 if __name__ == '__main__':
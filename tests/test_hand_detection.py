@@ -6,8 +6,64 @@ of the HandDetector class.
 """
 
 import unittest
+from dataclasses import dataclass
 import numpy as np
 import HandTrackingModule as htm
+import HandTrackingModule_fast as htm_fast
+from tests import load_kernels_without_numba
+
+
+# Mock MediaPipe result types; __slots__ is declared by hand because
+# dataclass(slots=True) needs Python 3.10
+@dataclass(frozen=True)
+class MockLandmark:
+    __slots__ = ('x', 'y')
+    x: float
+    y: float
+
+
+@dataclass(frozen=True)
+class MockHandLandmarks:
+    __slots__ = ('landmark',)
+    landmark: tuple
+    
+    @classmethod
+    def from_array(cls, coordinates):
+        """
+        Build a hand from an (N, 2) array of normalized (x, y) positions.
+        
+        Coordinates are cast to float32 in one pass, matching the precision
+        of MediaPipe's landmark fields.
+        """
+        rows = np.asarray(coordinates, dtype=np.float32).tolist()
+        return cls(tuple(MockLandmark(x, y) for x, y in rows))
+
+
+@dataclass(frozen=True)
+class MockResults:
+    __slots__ = ('multi_hand_landmarks',)
+    multi_hand_landmarks: tuple
+
+
+def _mock_hand(x=0.5, y=0.5):
+    """
+    Build a hand whose 21 landmarks all sit at the same normalized position.
+    """
+    return MockHandLandmarks.from_array(np.full((21, 2), (x, y)))
+
+
+# Shared read-only fixtures; tests that draw work on a copy
+_BLANK_IMAGE = np.zeros((480, 640, 3), dtype=np.uint8)
+_BLANK_IMAGE.setflags(write=False)
+
+_MOCK_RESULTS_1H = MockResults((_mock_hand(),))
+_MOCK_RESULTS_2H = MockResults((
+    _mock_hand(0.5 + 0.0),  # Hand 0
+    _mock_hand(0.5 + 0.1),  # Hand 1
+))
+_EXPECTED_1H_POSITIONS = np.column_stack(
+    (np.arange(21), np.full(21, 320), np.full(21, 240))
+)
 
 
 class TestHandDetection(unittest.TestCase):
@@ -15,18 +71,24 @@ class TestHandDetection(unittest.TestCase):
     Test cases for hand detection functionality.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up one detector shared by every test method.
+        """
+        cls.detector = htm.HandDetector()
+    
+    def tearDown(self):
         """
-        Set up test fixtures before each test method.
+        Clear results set by a test so the next one starts with no hands.
         """
-        self.detector = htm.HandDetector()
+        self.detector.results = None
     
     def test_find_hands_with_image(self):
         """
         Test find_hands method with a mock image.
         """
-        # Create a mock image
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_image = _BLANK_IMAGE
         
         # Test find_hands without drawing
         result_image = self.detector.find_hands(mock_image, draw=False)
@@ -35,8 +97,8 @@ class TestHandDetection(unittest.TestCase):
         self.assertIsNotNone(result_image)
         self.assertEqual(result_image.shape, mock_image.shape)
         
-        # Test find_hands with drawing
-        result_image_draw = self.detector.find_hands(mock_image, draw=True)
+        # Test find_hands with drawing (which may write into the image)
+        result_image_draw = self.detector.find_hands(mock_image.copy(), draw=True)
         self.assertIsNotNone(result_image_draw)
         self.assertEqual(result_image_draw.shape, mock_image.shape)
     
@@ -57,8 +119,7 @@ class TestHandDetection(unittest.TestCase):
         """
         Test find_position when no hands are detected.
         """
-        # Create mock image
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_image = _BLANK_IMAGE
         
         # Simulate no hands detected by not calling find_hands first
         landmark_list = self.detector.find_position(mock_image, hand_number=0, draw=False)
@@ -70,25 +131,10 @@ class TestHandDetection(unittest.TestCase):
         """
         Test find_position with mock landmark data.
         """
-        # Create mock image
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
-        
-        # Create mock results object
-        class MockLandmark:
-            def __init__(self, x, y):
-                self.x = x
-                self.y = y
-        
-        class MockHandLandmarks:
-            def __init__(self):
-                self.landmark = [MockLandmark(0.5, 0.5) for _ in range(21)]
-        
-        class MockResults:
-            def __init__(self):
-                self.multi_hand_landmarks = [MockHandLandmarks()]
+        mock_image = _BLANK_IMAGE
         
         # Set mock results
-        self.detector.results = MockResults()
+        self.detector.results = _MOCK_RESULTS_1H
         
         # Test find_position
         landmark_list = self.detector.find_position(mock_image, hand_number=0, draw=False)
@@ -96,37 +142,20 @@ class TestHandDetection(unittest.TestCase):
         # Should return 21 landmarks
         self.assertEqual(len(landmark_list), 21)
         
-        # Check landmark format [id, x, y]
-        for i, landmark in enumerate(landmark_list):
-            self.assertEqual(len(landmark), 3)
-            self.assertEqual(landmark[0], i)  # ID should match index
-            self.assertEqual(landmark[1], 320)  # x = 0.5 * 640
-            self.assertEqual(landmark[2], 240)  # y = 0.5 * 480
+        # Check landmark format [id, x, y]: ID matches index,
+        # x = 0.5 * 640 and y = 0.5 * 480
+        np.testing.assert_array_equal(
+            np.array(landmark_list, dtype=int), _EXPECTED_1H_POSITIONS
+        )
     
     def test_find_position_different_hand_numbers(self):
         """
         Test find_position with different hand numbers.
         """
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
-        
-        # Create mock results with multiple hands
-        class MockLandmark:
-            def __init__(self, x, y):
-                self.x = x
-                self.y = y
+        mock_image = _BLANK_IMAGE
         
-        class MockHandLandmarks:
-            def __init__(self, offset_x=0.0):
-                self.landmark = [MockLandmark(0.5 + offset_x, 0.5) for _ in range(21)]
-        
-        class MockResults:
-            def __init__(self):
-                self.multi_hand_landmarks = [
-                    MockHandLandmarks(0.0),  # Hand 0
-                    MockHandLandmarks(0.1)   # Hand 1
-                ]
-        
-        self.detector.results = MockResults()
+        # Use mock results with multiple hands
+        self.detector.results = _MOCK_RESULTS_2H
         
         # Test hand 0
         landmarks_0 = self.detector.find_position(mock_image, hand_number=0, draw=False)
@@ -137,28 +166,41 @@ class TestHandDetection(unittest.TestCase):
         landmarks_1 = self.detector.find_position(mock_image, hand_number=1, draw=False)
         self.assertEqual(len(landmarks_1), 21)
         self.assertEqual(landmarks_1[0][1], 384)  # x = 0.6 * 640
+        
+        # Earlier results are unaffected by the reused landmark buffer
+        self.assertEqual(landmarks_0[0][1], 320)
+        array_0 = self.detector.find_landmarks(mock_image, hand_number=0, draw=False)
+        self.detector.find_landmarks(mock_image, hand_number=1, draw=False)
+        self.assertEqual(array_0[0, 0], 320)
     
-    def test_find_position_invalid_hand_number(self):
+    def test_find_position_new_results_refresh_landmarks(self):
         """
-        Test find_position with invalid hand number.
+        Test that landmarks are re-read when a new results object arrives.
         """
-        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_image = _BLANK_IMAGE
         
-        # Create mock results with one hand
-        class MockLandmark:
-            def __init__(self, x, y):
-                self.x = x
-                self.y = y
+        self.detector.results = MockResults((_mock_hand(0.25),))
+        first = self.detector.find_position(mock_image, hand_number=0, draw=False)
         
-        class MockHandLandmarks:
-            def __init__(self):
-                self.landmark = [MockLandmark(0.5, 0.5) for _ in range(21)]
+        # More hands than max_hands and a fresh object both invalidate the cache
+        self.detector.results = MockResults(
+            (_mock_hand(0.5), _mock_hand(0.75), _mock_hand(1.0))
+        )
+        second = self.detector.find_position(mock_image, hand_number=0, draw=False)
+        last = self.detector.find_position(mock_image, hand_number=2, draw=False)
         
-        class MockResults:
-            def __init__(self):
-                self.multi_hand_landmarks = [MockHandLandmarks()]
+        self.assertEqual(first[0][1], 160)   # x = 0.25 * 640
+        self.assertEqual(second[0][1], 320)  # x = 0.5 * 640
+        self.assertEqual(last[0][1], 640)    # x = 1.0 * 640
+    
+    def test_find_position_invalid_hand_number(self):
+        """
+        Test find_position with invalid hand number.
+        """
+        mock_image = _BLANK_IMAGE
         
-        self.detector.results = MockResults()
+        # Use mock results with one hand
+        self.detector.results = _MOCK_RESULTS_1H
         
         # Test with hand number that doesn't exist
         landmarks = self.detector.find_position(mock_image, hand_number=5, draw=False)
@@ -171,24 +213,13 @@ class TestHandDetection(unittest.TestCase):
         mock_image = np.zeros((100, 200, 3), dtype=np.uint8)  # Small image
         
         # Create mock results with edge coordinates
-        class MockLandmark:
-            def __init__(self, x, y):
-                self.x = x
-                self.y = y
-        
-        class MockHandLandmarks:
-            def __init__(self):
-                self.landmark = [
-                    MockLandmark(0.0, 0.0),    # Top-left
-                    MockLandmark(1.0, 1.0),    # Bottom-right
-                    MockLandmark(0.5, 0.5),   # Center
-                ] + [MockLandmark(0.5, 0.5) for _ in range(18)]  # Fill to 21
+        edge_hand = MockHandLandmarks.from_array([
+            (0.0, 0.0),    # Top-left
+            (1.0, 1.0),    # Bottom-right
+            (0.5, 0.5),   # Center
+        ] + [(0.5, 0.5)] * 18)  # Fill to 21
         
-        class MockResults:
-            def __init__(self):
-                self.multi_hand_landmarks = [MockHandLandmarks()]
-        
-        self.detector.results = MockResults()
+        self.detector.results = MockResults((edge_hand,))
         
         landmarks = self.detector.find_position(mock_image, hand_number=0, draw=False)
         
@@ -199,6 +230,81 @@ class TestHandDetection(unittest.TestCase):
         self.assertEqual(landmarks[1][2], 100) # y = 1.0 * 100
         self.assertEqual(landmarks[2][1], 100) # x = 0.5 * 200
         self.assertEqual(landmarks[2][2], 50)  # y = 0.5 * 100
+    
+    def test_find_landmarks_array(self):
+        """
+        Test find_landmarks returns a (21, 2) int32 array matching find_position.
+        """
+        mock_image = _BLANK_IMAGE
+        
+        spread_hand = MockHandLandmarks.from_array(
+            np.column_stack((np.arange(21) / 21, np.full(21, 0.5)))
+        )
+        self.detector.results = MockResults((spread_hand,))
+        
+        landmarks = self.detector.find_landmarks(mock_image, hand_number=0, draw=False)
+        landmark_list = self.detector.find_position(mock_image, hand_number=0, draw=False)
+        
+        self.assertEqual(landmarks.shape, (21, 2))
+        self.assertEqual(landmarks.dtype, np.int32)
+        
+        # Row index is the landmark ID
+        for landmark_id, x, y in landmark_list:
+            self.assertEqual(landmarks[landmark_id].tolist(), [x, y])
+    
+    def test_landmarks_to_pixels_numpy_fallback(self):
+        """
+        Test the pixel conversion kernel and its NumPy fallback agree.
+        """
+        # Off-frame landmarks are negative or above 1.0 and truncate toward zero
+        normalized = np.linspace(-0.2, 1.2, 2 * 21).reshape(21, 2)
+        
+        fallback = load_kernels_without_numba()
+        
+        expected = np.column_stack((
+            np.arange(21),
+            [int(x * 640) for x in normalized[:, 0].tolist()],
+            [int(y * 480) for y in normalized[:, 1].tolist()],
+        ))
+        for kernel in (htm_fast.landmarks_to_pixels, fallback.landmarks_to_pixels):
+            out = np.zeros((21, 3), dtype=np.int32)
+            out[:, 0] = np.arange(21)
+            kernel(normalized, 640, 480, out)
+            np.testing.assert_array_equal(out, expected)
+    
+    def test_find_landmarks_no_hands_detected(self):
+        """
+        Test find_landmarks returns an empty array when no hands are detected.
+        """
+        mock_image = _BLANK_IMAGE
+        
+        landmarks = self.detector.find_landmarks(mock_image, hand_number=0, draw=False)
+        
+        self.assertEqual(landmarks.shape, (0, 2))
+        self.assertEqual(len(landmarks), 0)
+    
+    def test_draw_landmarks(self):
+        """
+        Test draw_landmarks draws a skeleton and tolerates an empty array.
+        """
+        mock_image = _BLANK_IMAGE.copy()
+        
+        # Empty array (no hand detected) leaves the image untouched
+        empty = np.empty((0, 2), dtype=np.int32)
+        result_image = self.detector.draw_landmarks(mock_image, empty)
+        self.assertEqual(result_image.sum(), 0)
+        
+        landmarks = np.column_stack((
+            np.linspace(100, 500, 21), np.linspace(100, 400, 21)
+        )).astype(np.int32)
+        result_image = self.detector.draw_landmarks(mock_image, landmarks)
+        
+        self.assertEqual(result_image.shape, (480, 640, 3))
+        self.assertGreater(result_image.sum(), 0)
+        
+        # Every landmark position has a point drawn on it
+        for x, y in landmarks.tolist():
+            self.assertTrue(result_image[y, x].any())
 
 
 if __name__ == '__main__':
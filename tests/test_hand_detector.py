@@ -7,6 +7,8 @@ the distance calculation method and other core functionality.
 
 import unittest
 import math
+import queue
+import threading
 import numpy as np
 import HandTrackingModule as htm
 
@@ -16,11 +18,12 @@ class TestHandDetector(unittest.TestCase):
     Test cases for HandDetector class methods.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up test fixtures before each test method.
+        Create one shared detector; find_distance itself needs no instance.
         """
-        self.detector = htm.HandDetector()
+        cls.detector = htm.HandDetector()
     
     def test_find_distance_basic(self):
         """
@@ -29,7 +32,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [0, 0]
         point2 = [3, 4]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         # Test distance calculation (3-4-5 triangle)
         self.assertAlmostEqual(distance, 5.0, places=5)
@@ -44,7 +47,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [4, 100, 200]  # Thumb tip
         point2 = [8, 150, 180]  # Index finger tip
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         # Calculate expected distance
         expected_distance = math.sqrt((150 - 100)**2 + (180 - 200)**2)
@@ -60,7 +63,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [50, 100]
         point2 = [50, 100]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         self.assertEqual(distance, 0.0)
         self.assertEqual(coords, [50, 100, 50, 100])
@@ -72,7 +75,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [-10, -20]
         point2 = [10, 20]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt((10 - (-10))**2 + (20 - (-20))**2)
         self.assertAlmostEqual(distance, expected_distance, places=5)
@@ -85,7 +88,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [0, 0]
         point2 = [1000, 1000]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt(1000**2 + 1000**2)
         self.assertAlmostEqual(distance, expected_distance, places=5)
@@ -98,7 +101,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [1.5, 2.5]
         point2 = [4.5, 6.5]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt((4.5 - 1.5)**2 + (6.5 - 2.5)**2)
         self.assertAlmostEqual(distance, expected_distance, places=5)
@@ -114,7 +117,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [100, 200]
         point2 = [300, 400]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, mock_image, True
         )
         
@@ -138,7 +141,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [50, 75]
         point2 = [150, 175]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, mock_image, False
         )
         
@@ -156,7 +159,7 @@ class TestHandDetector(unittest.TestCase):
         point1 = [0, 0]
         point2 = [5, 12]
         
-        distance, returned_image, coords = self.detector.find_distance(
+        distance, returned_image, coords = htm.HandDetector.find_distance(
             point1, point2, None, True
         )
         
@@ -173,12 +176,13 @@ class TestHandDetector(unittest.TestCase):
         """
         Test HandDetector initialization with default parameters.
         """
-        detector = htm.HandDetector()
+        detector = self.detector
         
         self.assertFalse(detector.static_image_mode)
         self.assertEqual(detector.max_hands, 2)
         self.assertEqual(detector.detection_confidence, 0.5)
         self.assertEqual(detector.tracking_confidence, 0.5)
+        self.assertEqual(detector.inference_scale, 1.0)
     
     def test_detector_initialization_custom_params(self):
         """
@@ -195,6 +199,41 @@ class TestHandDetector(unittest.TestCase):
         self.assertEqual(detector.max_hands, 1)
         self.assertEqual(detector.detection_confidence, 0.8)
         self.assertEqual(detector.tracking_confidence, 0.9)
+    
+    def test_detector_inference_scale(self):
+        """
+        Test downscaled inference accepts full-size frames and validates its range.
+        """
+        detector = htm.HandDetector(inference_scale=0.5)
+        self.assertEqual(detector.inference_scale, 0.5)
+        
+        mock_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        result_image = detector.find_hands(mock_image, draw=False)
+        
+        # The caller's frame is returned at full size
+        self.assertEqual(result_image.shape, (480, 640, 3))
+        
+        for invalid_scale in (0.0, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                htm.HandDetector(inference_scale=invalid_scale)
+    
+    def test_detector_opencl_preprocessing(self):
+        """
+        Test the OpenCL preprocessing path matches the CPU path.
+        """
+        detector = htm.HandDetector(inference_scale=0.5, use_opencl=True)
+        
+        # Only enabled when the machine actually has an OpenCL device
+        self.assertEqual(detector.use_opencl, htm.cv2.ocl.haveOpenCL())
+        
+        # UMat operations still run (on the CPU) without an OpenCL device
+        mock_image = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        opencl_rgb = detector._to_rgb_opencl(mock_image)
+        cpu_rgb = detector._to_rgb(mock_image)
+        
+        self.assertEqual(opencl_rgb.shape, (240, 320, 3))
+        # Device kernels may round the area interpolation differently
+        np.testing.assert_allclose(opencl_rgb.astype(np.int16), cpu_rgb.astype(np.int16), atol=1)
 
 
 class TestDistanceCalculationEdgeCases(unittest.TestCase):
@@ -202,12 +241,6 @@ class TestDistanceCalculationEdgeCases(unittest.TestCase):
     Test edge cases for distance calculation.
     """
     
-    def setUp(self):
-        """
-        Set up test fixtures before each test method.
-        """
-        self.detector = htm.HandDetector()
-    
     def test_find_distance_very_small_distance(self):
         """
         Test distance calculation with very small distances.
@@ -215,7 +248,7 @@ class TestDistanceCalculationEdgeCases(unittest.TestCase):
         point1 = [0.0, 0.0]
         point2 = [0.001, 0.001]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt(0.001**2 + 0.001**2)
         self.assertAlmostEqual(distance, expected_distance, places=10)
@@ -227,7 +260,7 @@ class TestDistanceCalculationEdgeCases(unittest.TestCase):
         point1 = [0, 0]
         point2 = [1000000, 1000000]
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt(1000000**2 + 1000000**2)
         self.assertAlmostEqual(distance, expected_distance, places=5)
@@ -239,13 +272,154 @@ class TestDistanceCalculationEdgeCases(unittest.TestCase):
         point1 = [4, 100, 200]  # [id, x, y] format
         point2 = [150, 180]      # [x, y] format
         
-        distance, _, coords = self.detector.find_distance(point1, point2, None, False)
+        distance, _, coords = htm.HandDetector.find_distance(point1, point2, None, False)
         
         expected_distance = math.sqrt((150 - 100)**2 + (180 - 200)**2)
         self.assertAlmostEqual(distance, expected_distance, places=5)
         self.assertEqual(coords, [100, 200, 150, 180])
 
 
+class TestReadLatestFrame(unittest.TestCase):
+    """
+    Test cases for the stale-frame skipping camera helper.
+    """
+    
+    class MockCapture:
+        def __init__(self, grab_ok=True, buffer_size=0):
+            self.grab_ok = grab_ok
+            self.buffer_size = buffer_size
+            self.grabs = 0
+            self.retrieves = 0
+        
+        def get(self, prop_id):
+            # 0 means the backend doesn't report its queue depth
+            assert prop_id == htm.cv2.CAP_PROP_BUFFERSIZE
+            return float(self.buffer_size)
+        
+        def grab(self):
+            self.grabs += 1
+            return self.grab_ok
+        
+        def retrieve(self):
+            self.retrieves += 1
+            return True, np.zeros((480, 640, 3), dtype=np.uint8)
+    
+    class QueuedCapture(MockCapture):
+        """
+        Capture whose grab() blocks for a new frame once its queue is empty.
+        """
+        
+        def __init__(self, buffer_size):
+            super().__init__(buffer_size=buffer_size)
+            self.queued = buffer_size
+            self.blocking_grabs = 0
+        
+        def grab(self):
+            if self.queued:
+                self.queued -= 1
+            else:
+                self.blocking_grabs += 1
+            return super().grab()
+    
+    def test_no_stale_frames(self):
+        """
+        Test that a fast loop grabs and decodes exactly one frame.
+        """
+        cap = self.MockCapture()
+        success, image = htm.read_latest_frame(cap, elapsed=0.0)
+        
+        self.assertTrue(success)
+        self.assertEqual(image.shape, (480, 640, 3))
+        self.assertEqual(cap.grabs, 1)
+        self.assertEqual(cap.retrieves, 1)
+    
+    def test_stale_frames_skipped_without_decoding(self):
+        """
+        Test that frames queued during a slow iteration are grabbed, not decoded.
+        """
+        cap = self.MockCapture()
+        htm.read_latest_frame(cap, elapsed=0.1, target_fps=30)
+        
+        # 0.1 s at 30 FPS leaves 3 stale frames, plus the one returned
+        self.assertEqual(cap.grabs, 4)
+        self.assertEqual(cap.retrieves, 1)
+    
+    def test_stale_frames_capped(self):
+        """
+        Test that a very long stall doesn't drain an unbounded number of frames.
+        """
+        cap = self.MockCapture()
+        htm.read_latest_frame(cap, elapsed=1000.0)
+        
+        self.assertEqual(cap.grabs, htm.MAX_STALE_FRAMES + 1)
+    
+    def test_stale_frames_limited_to_queue_depth(self):
+        """
+        Test that skipping frames never grabs past the driver-side queue.
+        """
+        # A honoured 1-frame buffer holds nothing stale beyond the newest frame
+        cap = self.QueuedCapture(buffer_size=1)
+        htm.read_latest_frame(cap, elapsed=0.05)
+        
+        self.assertEqual(cap.grabs, 1)
+        self.assertEqual(cap.blocking_grabs, 0)
+        
+        # A deeper queue is drained, but only as far as it goes
+        cap = self.QueuedCapture(buffer_size=3)
+        htm.read_latest_frame(cap, elapsed=1000.0)
+        
+        self.assertEqual(cap.grabs, 3)
+        self.assertEqual(cap.blocking_grabs, 0)
+    
+    def test_failed_grab(self):
+        """
+        Test that a failed grab reports failure without retrieving.
+        """
+        cap = self.MockCapture(grab_ok=False)
+        success, image = htm.read_latest_frame(cap, elapsed=0.0)
+        
+        self.assertFalse(success)
+        self.assertIsNone(image)
+        self.assertEqual(cap.retrieves, 0)
+
+
+class TestPipelineWorkers(unittest.TestCase):
+    """
+    Test cases for the queue helpers used by HandTrackingPipeline.
+    """
+    
+    def test_put_latest_replaces_stale_item(self):
+        """
+        Test that put_latest keeps only the newest item on a full queue.
+        """
+        item_queue = queue.Queue(maxsize=1)
+        
+        htm.put_latest(item_queue, "old")
+        htm.put_latest(item_queue, "new")
+        
+        self.assertEqual(item_queue.get_nowait(), "new")
+        self.assertTrue(item_queue.empty())
+    
+    def test_inference_worker_processes_until_end_of_stream(self):
+        """
+        Test that inference_worker publishes landmarks and then None.
+        """
+        frame_queue = queue.Queue()
+        result_queue = queue.Queue()
+        
+        frame_queue.put(np.zeros((480, 640, 3), dtype=np.uint8))
+        frame_queue.put(None)
+        
+        # Runs in-process; the worker returns once it sees the None sentinel
+        htm.inference_worker(frame_queue, result_queue, threading.Event(),
+                             draw=True, detector_kwargs={"max_hands": 1})
+        
+        image, landmarks = result_queue.get_nowait()
+        self.assertEqual(image.shape, (480, 640, 3))
+        self.assertEqual(landmarks.shape, (0, 2))
+        self.assertIsNone(result_queue.get_nowait())
+
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)